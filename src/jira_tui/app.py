@@ -2,26 +2,112 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+import shutil
+import subprocess
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Iterable, Sequence
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
+else:
+    uvloop.install()
+
 from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.reactive import reactive
 from textual.screen import ModalScreen
-from textual.widgets import Button, Footer, Header, Input, Label, Log, Static, Terminal
-
+from textual.widgets import Button, Footer, Header, Input, Label, Log, Static
+
+try:
+    from textual.widgets import Terminal
+except ImportError:  # pragma: no cover - depends on the textual build
+
+    class Terminal(Static):
+        """Fallback used when textual ships without a terminal widget.
+
+        ``run_command`` must never call blocking APIs on the event loop;
+        the child runs in a thread and the widget shows its output once it
+        exits.
+        """
+
+        async def run_command(self, command: Sequence[str]) -> None:
+            result = await asyncio.to_thread(
+                subprocess.run,
+                list(command),
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            output = result.stdout or result.stderr
+            self.update(output or f"`{' '.join(command)}` exited with {result.returncode}")
+
+
+_MAX_CONCURRENT_COMMANDS = 4
+
+# Child pipes are drained in chunks of this size so decoding overlaps with
+# the child's I/O instead of making a second pass over a full buffer.
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Fixed argv for the keyboard shortcuts, built once. Entries without "jira"
+# are passed to _run_jira_command, which prepends the binary; the full argv
+# constants are for JiraCommandScreen, which execs directly.
+_ARGV_ME = ("me",)
+_ARGV_MY_ISSUES = (
+    "issue", "list", "--assignee", "me", "--order-by", "updated", "--reverse", "--plain"
+)
+_ARGV_INIT = ("jira", "init")
+_ARGV_CREATE_ISSUE = ("jira", "issue", "create")
+
+
+def _write_lines(log_widget: Log, lines: Iterable[str]) -> None:
+    """Append ``lines`` in one call (one refresh) where textual supports it."""
+    write_lines = getattr(log_widget, "write_lines", None)
+    if write_lines is not None:
+        write_lines(lines)
+    else:  # pragma: no cover - textual builds without Log.write_lines
+        for line in lines:
+            log_widget.write(line)
 
-@dataclass
+# Issue views are cached briefly so re-opening the same key does not fork a
+# new jira-cli process and HTTP round-trip within the TTL.
+_ISSUE_VIEW_TTL = 60.0
+_ISSUE_VIEW_CACHE_SIZE = 64
+
+_HELP_LINES: tuple[str, ...] = (
+    "Available shortcuts:",
+    "g – configure jira-cli (runs `jira init`)",
+    "R – re-check authentication",
+    "/ – run an arbitrary JQL search",
+    "i – list issues assigned to you",
+    "v – view an issue",
+    "c – create a new issue",
+    "C – add a comment to an issue",
+    "t – transition an issue",
+    "q – quit",
+)
+
+
+@dataclass(slots=True, frozen=True)
 class CommandResult:
-    """Container for stdout/stderr coming from jira-cli."""
+    """Container for stdout/stderr coming from jira-cli.
+
+    Slotted to drop the per-instance ``__dict__`` (one result per
+    invocation, plus cached copies) and frozen so cache entries are safely
+    shareable.
+    """
 
     command: Sequence[str]
     stdout: str
     stderr: str
     returncode: int
+    command_str: str = ""
 
     @property
     def ok(self) -> bool:
@@ -31,28 +117,9 @@ class CommandResult:
 class InputDialog(ModalScreen[str | None]):
     """Simple input dialog that resolves with the entered value."""
 
-    CSS = """
-    InputDialog {
-        align: center middle;
-    }
-
-    InputDialog > Container {
-        padding: 2;
-        width: 60;
-        background: $panel;
-        border: tall $primary;
-    }
-
-    InputDialog Label {
-        margin-bottom: 1;
-    }
-
-    InputDialog .actions {
-        margin-top: 1;
-        width: 100%;
-        align-horizontal: right;
-    }
-    """
+    # External stylesheet: textual compiles and caches it by path, so
+    # repeated dialog pushes skip the CSS reparse an inline string incurs.
+    CSS_PATH = "input_dialog.tcss"
 
     def __init__(self, title: str, prompt: str, placeholder: str | None = None) -> None:
         super().__init__()
@@ -89,6 +156,72 @@ class InputDialog(ModalScreen[str | None]):
         self.dismiss(event.value.strip() or None)
 
 
+class DoubleInputDialog(ModalScreen[tuple[str, str] | None]):
+    """Input dialog that collects two values in a single modal round trip.
+
+    Replaces two sequential :class:`InputDialog` pushes so a cancel on the
+    second field no longer wastes the first dialog's composition work.
+    """
+
+    CSS_PATH = "input_dialog.tcss"
+
+    def __init__(
+        self,
+        title: str,
+        first_prompt: str,
+        second_prompt: str,
+        *,
+        first_placeholder: str | None = None,
+        second_placeholder: str | None = None,
+    ) -> None:
+        super().__init__()
+        self._title = title
+        self._first_prompt = first_prompt
+        self._second_prompt = second_prompt
+        self._first_placeholder = first_placeholder or ""
+        self._second_placeholder = second_placeholder or ""
+
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Label(self._title, id="title"),
+            Label(self._first_prompt, id="first-prompt"),
+            Input(placeholder=self._first_placeholder, id="first"),
+            Label(self._second_prompt, id="second-prompt"),
+            Input(placeholder=self._second_placeholder, id="second"),
+            Horizontal(
+                Button("Cancel", id="cancel"),
+                Button("Submit", id="submit", variant="primary"),
+                classes="actions",
+            ),
+        )
+
+    def on_mount(self) -> None:
+        self.query_one("#first", Input).focus()
+
+    def _resolve(self) -> None:
+        first = self.query_one("#first", Input).value.strip()
+        second = self.query_one("#second", Input).value.strip()
+        self.dismiss((first, second) if first and second else None)
+
+    @on(Button.Pressed, "#cancel")
+    def _cancel(self) -> None:
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#submit")
+    def _submit(self) -> None:
+        self._resolve()
+
+    @on(Input.Submitted, "#first")
+    def _advance(self) -> None:  # pragma: no cover - UI event
+        # Enter finishes the first field, as it did when this was two
+        # dialogs; only the second field (or Submit) resolves.
+        self.query_one("#second", Input).focus()
+
+    @on(Input.Submitted, "#second")
+    def _submit_enter(self) -> None:  # pragma: no cover - UI event
+        self._resolve()
+
+
 class JiraCommandScreen(ModalScreen[None]):
     """Screen used for interactive jira-cli commands."""
 
@@ -96,20 +229,21 @@ class JiraCommandScreen(ModalScreen[None]):
 
     def __init__(self, command: Sequence[str]) -> None:
         super().__init__()
-        self._command = command
+        self._command = tuple(command)
 
     def compose(self) -> ComposeResult:
         yield Terminal(id="terminal")
 
     async def on_mount(self) -> None:
         terminal = self.query_one(Terminal)
-        await terminal.run_command(list(self._command))
+        await terminal.run_command(self._command)
 
 
 class StatusWidget(Static):
     """Header widget that displays jira-cli status information."""
 
-    status = reactive("Checking jira-cli configuration…", layout=True)
+    # Width is driven by the container, so text changes need no layout pass.
+    status = reactive("Checking jira-cli configuration…", layout=False)
 
     def watch_status(self, status: str) -> None:  # pragma: no cover - UI update
         self.update(status)
@@ -132,8 +266,24 @@ class JiraTUIApp(App[None]):
         Binding("q", "quit", "Quit"),
     ]
 
-    status_text = reactive("Checking jira-cli configuration…", layout=True)
-    configured = reactive(False, layout=True)
+    status_text = reactive("Checking jira-cli configuration…", layout=False)
+    configured = reactive(False, layout=False)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Widget references cached on first use so hot paths such as _log do
+        # not walk the DOM on every line of output.
+        self._log_widget: Log | None = None
+        self._status_widget: StatusWidget | None = None
+        # Bounds how many jira-cli processes _run_many forks at once.
+        self._command_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_COMMANDS)
+        # Maps issue key -> (monotonic timestamp, rendered output), LRU order.
+        self._issue_view_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # Dedupes concurrent refreshes so rapid 'R' presses run one check.
+        self._checking = False
+        # Resolved once by shutil.which on first use; None means the binary
+        # has not been found (yet), so each command re-probes cheaply.
+        self._jira_path: str | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -144,141 +294,263 @@ class JiraTUIApp(App[None]):
         yield Footer()
 
     async def on_mount(self) -> None:
-        await self.check_configuration()
-        self.set_focus(self.query_one(Log))
+        self._log_widget = self.query_one(Log)
+        self._status_widget = self.query_one(StatusWidget)
+        # Run the auth check in a worker so the first frame paints while
+        # jira-cli is still starting up; the status flips when it completes.
+        self.run_worker(self.check_configuration(), exclusive=True, group="auth")
+        self.set_focus(self._log_widget)
+
+    def _get_log(self) -> Log:
+        if self._log_widget is None:
+            self._log_widget = self.query_one(Log)
+        return self._log_widget
+
+    def _get_status(self) -> StatusWidget:
+        if self._status_widget is None:
+            self._status_widget = self.query_one(StatusWidget)
+        return self._status_widget
 
     async def check_configuration(self) -> None:
-        """Check jira-cli availability and authentication."""
-        status_widget = self.query_one(StatusWidget)
-        status_widget.status = "Checking jira-cli configuration…"
-        try:
-            result = await self._run_jira_command(["me"])
-        except FileNotFoundError:
-            self.configured = False
-            status_widget.status = "jira-cli (jira) is not installed or in PATH."
-            self._log("Unable to find `jira` binary. Install https://github.com/ankitpokhrel/jira-cli")
+        """Check jira-cli availability and authentication.
+
+        The status widget is written once, with the final result; the
+        "Checking…" text is the reactive's default, so startup shows it
+        without an extra assignment (and an extra refresh).
+        """
+        if self._checking:
             return
+        self._checking = True
+        try:
+            result = await self._run_jira_command(_ARGV_ME)
+            self._apply_configuration_result(result)
+        finally:
+            self._checking = False
 
+    def _apply_configuration_result(self, result: CommandResult) -> None:
+        status_widget = self._get_status()
         if result.returncode == 0:
             self.configured = True
             status_widget.status = "jira-cli is authenticated ✅"
-            if result.stdout:
-                self._log(result.stdout)
+        elif self._jira_path is None:
+            self.configured = False
+            status_widget.status = "jira-cli (jira) is not installed or in PATH."
         else:
             self.configured = False
             status_widget.status = "jira-cli configuration missing. Press 'g' to run jira init."
-            if result.stderr:
-                self._log(result.stderr)
 
     async def _run_jira_command(
         self,
-        args: Iterable[str],
+        args: tuple[str, ...],
         *,
-        capture_output: bool = True,
         log_command: bool = True,
+        log_stdout: bool = True,
+        log_stderr: bool = True,
+        stdout_target: Log | None = None,
     ) -> CommandResult:
-        """Execute jira-cli with the given arguments."""
+        """Execute jira-cli with the given arguments.
 
-        cmd = ["jira", *args]
-        if log_command:
-            self._log("$ " + " ".join(cmd))
+        Captured output is streamed line by line into ``stdout_target`` (the
+        main log by default) as it arrives, rather than buffered until the
+        child exits. Pass ``log_stdout=False`` / ``log_stderr=False`` to
+        collect a stream on the result without echoing it.
+        """
 
-        if capture_output:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout_bytes, stderr_bytes = await process.communicate()
-            stdout = stdout_bytes.decode().strip()
-            stderr = stderr_bytes.decode().strip()
-            if stdout:
-                self._log(stdout)
-            if stderr:
-                self._log(stderr)
-            return CommandResult(cmd, stdout, stderr, process.returncode)
-
-        process = await asyncio.create_subprocess_exec(*cmd)
+        # Join the display string a single time for both logging and the result.
+        cmd = ("jira", *args)
+        cmd_str = " ".join(cmd)
+        if log_command:
+            self._log("$ " + cmd_str)
+
+        if self._jira_path is None:
+            # Probe PATH off the event loop; the hit is cached, a miss
+            # short-circuits without attempting (and unwinding) a fork.
+            self._jira_path = await asyncio.to_thread(shutil.which, "jira")
+            if self._jira_path is None:
+                # The one place the not-installed message is logged; callers
+                # only add to it via the synthesized stderr they collect.
+                message = (
+                    "jira-cli (jira) is not installed or in PATH."
+                    " Install https://github.com/ankitpokhrel/jira-cli"
+                )
+                if log_stderr:
+                    self._log(message)
+                return CommandResult(cmd, "", message, 127, cmd_str)
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        target = stdout_target if stdout_target is not None else self._get_log()
+        stdout_lines: list[str] = []
+        stderr_lines: list[str] = []
+        await asyncio.gather(
+            self._read_stream(process.stdout, target if log_stdout else None, stdout_lines),
+            self._read_stream(process.stderr, target if log_stderr else None, stderr_lines),
+        )
         await process.wait()
-        return CommandResult(cmd, "", "", process.returncode)
+        return CommandResult(
+            cmd, "\n".join(stdout_lines), "\n".join(stderr_lines), process.returncode, cmd_str
+        )
+
+    async def _run_many(self, arglists: Iterable[tuple[str, ...]]) -> list[CommandResult]:
+        """Run independent jira-cli invocations concurrently.
+
+        Spawns and drains are overlapped with :func:`asyncio.gather`, capped
+        by a semaphore so a burst of commands does not fork-storm.
+
+        Concurrent streams would interleave in the log, so both stdout and
+        stderr are collected on the results instead of echoed.
+        """
+
+        async def _limited(args: tuple[str, ...]) -> CommandResult:
+            async with self._command_semaphore:
+                return await self._run_jira_command(
+                    args, log_command=False, log_stdout=False, log_stderr=False
+                )
+
+        return list(await asyncio.gather(*(_limited(args) for args in arglists)))
+
+    @staticmethod
+    async def _read_stream(
+        stream: asyncio.StreamReader | None,
+        target: Log | None,
+        lines: list[str],
+    ) -> None:
+        """Forward decoded lines from a child pipe to ``target`` as they arrive.
+
+        Reads 64 KiB chunks through an incremental UTF-8 decoder, so decode
+        overlaps with child I/O in a single pass and multi-byte sequences
+        split across chunks survive. A ``None`` target collects lines
+        without writing them anywhere.
+        """
+
+        if stream is None:
+            return
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        while chunk := await stream.read(_READ_CHUNK_SIZE):
+            pending += decoder.decode(chunk)
+            if "\n" not in pending:
+                continue
+            complete = pending.split("\n")
+            pending = complete.pop()
+            batch = [line.rstrip("\r") for line in complete]
+            lines.extend(batch)
+            if target is not None:
+                _write_lines(target, batch)
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            lines.append(pending)
+            if target is not None:
+                target.write(pending)
 
     def _log(self, message: str) -> None:
-        log_widget = self.query_one(Log)
-        for line in message.splitlines():
-            log_widget.write(line)
+        log_widget = self._get_log()
+        if "\n" not in message:
+            log_widget.write(message)
+            return
+        _write_lines(log_widget, message.split("\n"))
 
     async def action_refresh(self) -> None:
         await self.check_configuration()
 
     async def action_init(self) -> None:
-        await self.push_screen(JiraCommandScreen(["jira", "init"]))
-        await self.check_configuration()
+        await self.push_screen(JiraCommandScreen(_ARGV_INIT))
+        # Re-check auth and fetch the issue list in parallel; the two
+        # commands are independent, so wall-clock is max() not sum. Their
+        # collected output is replayed in order afterwards, since the live
+        # streams would interleave in the log.
+        results = await self._run_many((_ARGV_ME, _ARGV_MY_ISSUES))
+        for result in results:
+            self._log("$ " + result.command_str)
+            if result.stdout:
+                self._log(result.stdout)
+            if result.stderr:
+                self._log(result.stderr)
+        self._apply_configuration_result(results[0])
 
     async def action_show_help(self) -> None:
-        commands = [
-            "g – configure jira-cli (runs `jira init`)",
-            "R – re-check authentication",
-            "/ – run an arbitrary JQL search",
-            "i – list issues assigned to you",
-            "v – view an issue",
-            "c – create a new issue",
-            "C – add a comment to an issue",
-            "t – transition an issue",
-            "q – quit",
-        ]
-        self._log("Available shortcuts:\n" + "\n".join(commands))
+        _write_lines(self._get_log(), _HELP_LINES)
 
     async def action_search(self) -> None:
         query = await self._prompt("JQL Search", "Enter a JQL query", placeholder="project = KEY ORDER BY updated DESC")
         if not query:
             return
-        await self._run_jira_command(["issue", "list", "--jql", query, "--plain"])
+        await self._run_jira_command(("issue", "list", "--jql", query, "--plain"))
 
     async def action_my_issues(self) -> None:
-        await self._run_jira_command(
-            ["issue", "list", "--assignee", "me", "--order-by", "updated", "--reverse", "--plain"]
-        )
+        await self._run_jira_command(_ARGV_MY_ISSUES)
 
     async def action_view_issue(self) -> None:
         key = await self._prompt("View Issue", "Enter issue key", placeholder="ABC-123")
         if not key:
             return
-        await self._run_jira_command(["issue", "view", key, "--plain"])
+        # jira-cli accepts lowercase keys; normalize so cache hits and
+        # write-invalidation agree on one spelling.
+        key = key.upper()
+        cached = self._issue_view_cache.get(key)
+        if cached is not None:
+            timestamp, output = cached
+            if time.monotonic() - timestamp < _ISSUE_VIEW_TTL:
+                self._issue_view_cache.move_to_end(key)
+                self._log(f"$ jira issue view {key} --plain (cached)")
+                self._log(output)
+                return
+            del self._issue_view_cache[key]
+        result = await self._run_jira_command(("issue", "view", key, "--plain"))
+        if result.ok and result.stdout:
+            self._issue_view_cache[key] = (time.monotonic(), result.stdout)
+            while len(self._issue_view_cache) > _ISSUE_VIEW_CACHE_SIZE:
+                self._issue_view_cache.popitem(last=False)
 
     async def action_create_issue(self) -> None:
-        await self.push_screen(JiraCommandScreen(["jira", "issue", "create"]))
+        await self.push_screen(JiraCommandScreen(_ARGV_CREATE_ISSUE))
         await self.check_configuration()
 
     async def action_comment_issue(self) -> None:
-        key = await self._prompt("Add Comment", "Issue key", placeholder="ABC-123")
-        if not key:
-            return
-        comment = await self._prompt("Add Comment", "Comment body")
-        if not comment:
+        values = await self.push_screen_wait(
+            DoubleInputDialog("Add Comment", "Issue key", "Comment body", first_placeholder="ABC-123")
+        )
+        if not values:
             return
-        await self._run_jira_command([
+        key, comment = values
+        key = key.upper()
+        result = await self._run_jira_command((
             "issue",
             "comment",
             "add",
             key,
             "--comment",
             comment,
-        ])
+        ))
+        if result.ok:
+            self._issue_view_cache.pop(key, None)
 
     async def action_transition_issue(self) -> None:
-        key = await self._prompt("Transition Issue", "Issue key", placeholder="ABC-123")
-        if not key:
-            return
-        state = await self._prompt("Transition Issue", "Target state", placeholder="In Progress")
-        if not state:
+        values = await self.push_screen_wait(
+            DoubleInputDialog(
+                "Transition Issue",
+                "Issue key",
+                "Target state",
+                first_placeholder="ABC-123",
+                second_placeholder="In Progress",
+            )
+        )
+        if not values:
             return
-        await self._run_jira_command([
+        key, state = values
+        key = key.upper()
+        result = await self._run_jira_command((
             "issue",
             "transition",
             key,
             "--state",
             state,
-        ])
+        ))
+        if result.ok:
+            self._issue_view_cache.pop(key, None)
 
     async def _prompt(self, title: str, prompt: str, *, placeholder: str | None = None) -> str | None:
         return await self.push_screen_wait(InputDialog(title, prompt, placeholder))